@@ -6,6 +6,7 @@ Constants related to errors.
 """
 
 # region explicit re-export of error codes
+from vt.utils.errors.error_specs.error_codes import ExitCode as ExitCode
 from vt.utils.errors.error_specs.error_codes import EXIT_OK as EXIT_OK
 from vt.utils.errors.error_specs.error_codes import ERR_EXIT_OK as ERR_EXIT_OK
 from vt.utils.errors.error_specs.error_codes import ERR_GENERIC_ERR as ERR_GENERIC_ERR
@@ -57,12 +58,62 @@ from vt.utils.errors.error_specs.error_codes import (
 # endregion
 
 
-import pathlib as __pathlib
+from collections.abc import Iterator as _Iterator
+from collections.abc import Mapping as _Mapping
 
-type_name_map: dict[type, str] = {
-    str: "a string",
-    int: "an int",
-    float: "a float",
-    bool: "a boolean",
-    __pathlib.Path: "a Path",
-}
+
+class _LazyTypeNameMap(_Mapping[type, str]):
+    """
+    Read-only mapping of types to their names which defers importing ``pathlib`` till it is first looked-up.
+
+    Examples::
+
+        >>> _LazyTypeNameMap()[str]
+        'a string'
+
+        >>> import pathlib
+        >>> _LazyTypeNameMap().get(pathlib.Path)
+        'a Path'
+
+        >>> _LazyTypeNameMap().get(bytes) is None
+        True
+    """
+
+    __slots__ = ("_type_names",)
+
+    def __init__(self) -> None:
+        self._type_names: _Mapping[type, str] | None = None
+
+    def _get_type_names(self) -> _Mapping[type, str]:
+        if self._type_names is None:
+            import pathlib
+            from types import MappingProxyType
+
+            self._type_names = MappingProxyType(
+                {
+                    str: "a string",
+                    int: "an int",
+                    float: "a float",
+                    bool: "a boolean",
+                    pathlib.Path: "a Path",
+                }
+            )
+        return self._type_names
+
+    def __getitem__(self, key: type) -> str:
+        return self._get_type_names()[key]
+
+    def __iter__(self) -> _Iterator[type]:
+        return iter(self._get_type_names())
+
+    def __len__(self) -> int:
+        return len(self._get_type_names())
+
+    def __repr__(self) -> str:
+        return repr(dict(self._get_type_names()))
+
+
+type_name_map: _Mapping[type, str] = _LazyTypeNameMap()
+"""
+Read-only mapping of types to their names used in error messages. Can be looked-up without copying.
+"""
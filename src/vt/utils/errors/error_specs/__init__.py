@@ -6,6 +6,7 @@ Inclusive library for error handling.
 """
 
 # region re-export constants
+from vt.utils.errors.error_specs.__constants__ import ExitCode as ExitCode
 from vt.utils.errors.error_specs.__constants__ import EXIT_OK as EXIT_OK
 from vt.utils.errors.error_specs.__constants__ import ERR_EXIT_OK as ERR_EXIT_OK
 from vt.utils.errors.error_specs.__constants__ import ERR_GENERIC_ERR as ERR_GENERIC_ERR
@@ -40,8 +40,10 @@ class DefaultOrError[T](Protocol):
         :raise KeyError: a better context ``KeyError`` if it is decided to re raise the error by returning ``True``
             from ``self.raise_error``.
         """
-        errmsg = ErrorMsgFormer.errmsg_for_choices(emphasis=emphasis, choices=choices)
         if self.raise_error:
+            errmsg = ErrorMsgFormer.errmsg_for_choices(
+                emphasis=emphasis, choices=choices
+            )
             raise KeyError(f"{key_error}: {errmsg}")
         return default_level
 
@@ -119,11 +121,13 @@ class WarningWithDefault[T](DefaultOrError[T], Warner, Protocol):
         :raise KeyError: a better context ``KeyError`` if it is decided to re raise the error by returning ``True``
             from ``self.raise_error`` and ``self.warn_only`` is ``False``.
         """
-        errmsg = ErrorMsgFormer.errmsg_for_choices(emphasis=emphasis, choices=choices)
-        if self.warn_only:
-            vt_warn(f"{key_error}: {errmsg}", stack_level=3)
-        else:
-            if self.raise_error:
+        if self.warn_only or self.raise_error:
+            errmsg = ErrorMsgFormer.errmsg_for_choices(
+                emphasis=emphasis, choices=choices
+            )
+            if self.warn_only:
+                vt_warn(f"{key_error}: {errmsg}", stack_level=3)
+            else:
                 raise KeyError(f"{key_error}: {errmsg}")
         return default_level
 
@@ -5,7 +5,17 @@
 Utility methods for error specifications.
 """
 
-from typing import Any, Literal
+from collections.abc import Mapping
+from typing import Any, Final, Literal
+
+_AND: Final = "and"
+_OR: Final = "or"
+
+_NOT_ALLOWED_TOGETHER_SUFFIX: Final = " are not allowed together"
+_IS_REQUIRED_SUFFIX: Final = " is required"
+_ARE_REQUIRED_SUFFIX: Final = " are required"
+_UNEXPECTED_PREFIX: Final = "Unexpected "
+_UNEXPECTED_SUFFIX: Final = "."
 
 
 class ErrorMessageFormer:
@@ -27,37 +37,51 @@ class ErrorMessageFormer:
         'All a, b, and c are required'
     """
 
+    __slots__ = ("use_oxford_comma", "conjunctions")
+
     def __init__(
-        self, use_oxford_comma: bool = False, conjunctions: dict[str, str] | None = None
+        self,
+        use_oxford_comma: bool = False,
+        conjunctions: Mapping[str, str] | None = None,
     ):
         """
         :param use_oxford_comma: Whether to use an Oxford comma before the final conjunction.
         :param conjunctions: A mapping like {'and': 'and', 'or': 'or'} to customize conjunctions.
+
+            >>> former = ErrorMessageFormer()
+            >>> former.use_oxford_comma = True
+            >>> former.conjunctions['and'] = '&'
+            >>> former.not_allowed_together('a', 'b', 'c')
+            'a, b, & c are not allowed together'
         """
         self.use_oxford_comma = use_oxford_comma
-        self.conjunctions = conjunctions or {"and": "and", "or": "or"}
+        self.conjunctions = conjunctions or {_AND: _AND, _OR: _OR}
 
     def _join_args(
-        self, items: list[str], conj_type: Literal["and", "or"], surround_item: str = ""
+        self,
+        items: tuple[Any, ...],
+        conj_type: Literal["and", "or"],
+        surround_item: str = "",
     ) -> str:
         """
         Helper to join a list of arguments using the correct conjunction and comma rules.
 
-        :param items: List of argument names.
+        :param items: Argument names.
         :param conj_type: The type of conjunction to use ('and' or 'or').
         :param surround_item: surround each item with the given string.
         :return: Formatted string of argument names joined by the conjunction.
-        :raises KeyError: If the provided conjunction type is not in ``self.conjunctions``."""
+        """
         conjunction = self.conjunctions.get(conj_type, conj_type)
-        if surround_item:
-            items = [f"{surround_item}{item}{surround_item}" for item in items]
-        if len(items) == 2:
-            return f"{items[0]} {conjunction} {items[1]}"
-        elif len(items) > 2:
-            comma = "," if self.use_oxford_comma else ""
-            return f"{', '.join(items[:-1])}{comma} {conjunction} {items[-1]}"
-        else:
-            return items[0]
+        # surround is interleaved in the separator so that no per-item surrounded strings are built.
+        q = surround_item
+        n = len(items)
+        if n == 2:
+            return f"{q}{items[0]}{q} {conjunction} {q}{items[1]}{q}"
+        if n == 1:
+            return f"{q}{items[0]}{q}"
+        comma = "," if self.use_oxford_comma else ""
+        head = f"{q}, {q}".join(map(str, items[:-1]))
+        return f"{q}{head}{q}{comma} {conjunction} {q}{items[-1]}{q}"
 
     def not_allowed_together(
         self,
@@ -67,7 +91,7 @@ class ErrorMessageFormer:
         prefix: str = "",
         suffix: str = "",
         _prefix: str = "",
-        _suffix: str = " are not allowed together",
+        _suffix: str = _NOT_ALLOWED_TOGETHER_SUFFIX,
     ) -> str:
         """
         Builds and returns an error message for arguments that are not to be supplied together.
@@ -112,8 +136,11 @@ class ErrorMessageFormer:
         :return: Error message string.
         :raises KeyError: If 'and' conjunction is missing from configuration.
         """
-        all_args = [first_arg, second_arg, *args]
-        return f"{prefix}{_prefix}{self._join_args(all_args, 'and')}{_suffix}{suffix}"
+        if not args:
+            # fast path for the most common two argument case.
+            return f"{prefix}{_prefix}{first_arg} {self.conjunctions.get(_AND, _AND)} {second_arg}{_suffix}{suffix}"
+        joined = self._join_args((first_arg, second_arg, *args), "and")
+        return f"{prefix}{_prefix}{joined}{_suffix}{suffix}"
 
     def at_least_one_required(
         self,
@@ -123,7 +150,7 @@ class ErrorMessageFormer:
         prefix: str = "",
         suffix: str = "",
         _prefix: str = "",
-        _suffix: str = " is required",
+        _suffix: str = _IS_REQUIRED_SUFFIX,
     ) -> str:
         """
         Builds and returns an error message indicating that at least one of the arguments is required.
@@ -185,8 +212,10 @@ class ErrorMessageFormer:
         :return: Error message string.
         :raises KeyError: If 'or' conjunction is missing from configuration.
         """
-        all_args = [first_arg, second_arg, *args]
-        joined = self._join_args(all_args, "or")
+        if not args:
+            # fast path for the most common two argument case.
+            return f"{prefix}{_prefix}Either {first_arg} {self.conjunctions.get(_OR, _OR)} {second_arg}{_suffix}{suffix}"
+        joined = self._join_args((first_arg, second_arg, *args), "or")
         return f"{prefix}{_prefix}Either {joined}{_suffix}{suffix}"
 
     def all_required(
@@ -197,7 +226,7 @@ class ErrorMessageFormer:
         prefix: str = "",
         suffix: str = "",
         _prefix: str = "",
-        _suffix: str = " are required",
+        _suffix: str = _ARE_REQUIRED_SUFFIX,
     ) -> str:
         """
         Builds and returns an error message stating that all arguments must be supplied.
@@ -278,9 +307,11 @@ class ErrorMessageFormer:
         :return: Error message string.
         :raises KeyError: If 'and' conjunction is missing from configuration.
         """
-        all_args = [first_arg, second_arg, *args]
-        keyword = "Both" if len(all_args) == 2 else "All"
-        return f"{prefix}{_prefix}{keyword} {self._join_args(all_args, 'and')}{_suffix}{suffix}"
+        if not args:
+            # fast path for the most common two argument case.
+            return f"{prefix}{_prefix}Both {first_arg} {self.conjunctions.get(_AND, _AND)} {second_arg}{_suffix}{suffix}"
+        joined = self._join_args((first_arg, second_arg, *args), "and")
+        return f"{prefix}{_prefix}All {joined}{_suffix}{suffix}"
 
     def errmsg_for_choices(
         self,
@@ -289,8 +320,8 @@ class ErrorMessageFormer:
         choices: list[Any] | None = None,
         prefix: str = "",
         suffix: str = "",
-        _prefix: str = "Unexpected ",
-        _suffix: str = ".",
+        _prefix: str = _UNEXPECTED_PREFIX,
+        _suffix: str = _UNEXPECTED_SUFFIX,
     ) -> str:
         """
         Builds and returns an error message providing more context when a value is unexpectedly given.
@@ -342,6 +373,19 @@ class ErrorMessageFormer:
             ...     _suffix=' ❌', suffix=' Please try again.')
             "ERROR: [!] log level X. Choose from 'DEBUG', 'INFO' and 'WARNING' ❌ Please try again."
 
+        Choices are rendered as they are given, equal values of other types are not mixed up::
+
+            >>> ErrorMsgFormer.errmsg_for_choices(choices=[1, 0])
+            "Unexpected value. Choose from '1' and '0'."
+
+            >>> ErrorMsgFormer.errmsg_for_choices(choices=[True, False])
+            "Unexpected value. Choose from 'True' and 'False'."
+
+        Unhashable choices are also supported::
+
+            >>> ErrorMsgFormer.errmsg_for_choices(choices=[['a', 'b'], 'c'])
+            "Unexpected value. Choose from '['a', 'b']' and 'c'."
+
         Errmsg formation sequencing -> ``{prefix}{_prefix}{<formed-msg>}{_suffix}{suffix}``
 
         :param value: The value to illustrate (e.g., user-supplied value).
@@ -353,16 +397,16 @@ class ErrorMessageFormer:
         :param _suffix: Appended to the internal unformed error message.
         :return: The formed error message.
         """
-        msg = f"{prefix}{_prefix}{emphasis + ' ' if emphasis else ''}{value}"
-        if choices:
-            msg += f". Choose from {self._join_args(choices, 'and', surround_item="'")}"
-        msg += f"{_suffix}{suffix}"
-        return msg
+        emphasised = f"{emphasis} " if emphasis else ""
+        if not choices:
+            return f"{prefix}{_prefix}{emphasised}{value}{_suffix}{suffix}"
+        joined = self._join_args(tuple(choices), "and", surround_item="'")
+        return f"{prefix}{_prefix}{emphasised}{value}. Choose from {joined}{_suffix}{suffix}"
 
     def clone_with(
         self,
         use_oxford_comma: bool | None = None,
-        conjunctions: dict[str, str] | None = None,
+        conjunctions: Mapping[str, str] | None = None,
     ) -> "ErrorMessageFormer":
         """
         Returns a new instance of ErrorMessageFormer with the given overrides.
@@ -387,18 +431,17 @@ class ErrorMessageFormer:
             >>> custom.not_allowed_together('a', 'b', 'c')
             'a, b, --and-- c are not allowed together'
         """
+        if use_oxford_comma is None:
+            use_oxford_comma = self.use_oxford_comma
         return ErrorMessageFormer(
-            use_oxford_comma=use_oxford_comma
-            if use_oxford_comma is not None
-            else self.use_oxford_comma,
-            conjunctions=conjunctions or self.conjunctions.copy(),
+            use_oxford_comma, conjunctions or dict(self.conjunctions)
         )
 
     def __repr__(self) -> str:
         return (
             f"<{self.__class__.__name__}("
             f"use_oxford_comma={self.use_oxford_comma}, "
-            f"conjunctions={self.conjunctions})>"
+            f"conjunctions={dict(self.conjunctions)})>"
         )
 
 
@@ -6,56 +6,129 @@ Standard POSIX error codes taken from: https://tldp.org/LDP/abs/html/exitcodes.h
 Also taken from sysexit.h
 """
 
-EXIT_OK = 0
+from enum import IntEnum
+
+
+class ExitCode(IntEnum):
+    """
+    All the known exit codes. Codes sharing the same value are aliases of a single member.
+
+    Examples::
+
+        >>> ExitCode(127) is ExitCode.ERR_CMD_NOT_FOUND is ExitCode.ERR_FILE_NOT_FOUND
+        True
+
+        >>> ExitCode.ERR_DATA_FORMAT_ERR == 65
+        True
+    """
+
+    EXIT_OK = 0
+    "Everything is okay"
+
+    ERR_EXIT_OK = EXIT_OK
+    "Everything is okay"
+
+    ERR_GENERIC_ERR = 1
+    "Some generic error"
+
+    ERR_INVALID_USAGE = 2
+    "Invalid usage command"
+
+    ERR_STATE_ALREADY_EXISTS = 4
+    "State already exists"
+
+    ERR_FILE_ALREADY_EXISTS = ERR_STATE_ALREADY_EXISTS
+    "File already exists"
+
+    ERR_DIR_ALREADY_EXISTS = ERR_STATE_ALREADY_EXISTS
+    "Directory already exists"
+
+    ERR_DATA_FORMAT_ERR = 65  # EX_DATAERR in sysexits.h
+    "Data format error, for example, while reading from a config file"
+
+    ERR_UNAVAILABLE_SERVICE = 69  # EX_UNAVAILABLE in sysexit.h
+    "Service unavailable"
+
+    ERR_UNSTABLE_STATE = ERR_UNAVAILABLE_SERVICE  # EX_UNAVAILABLE in sysexit.h
+    "Service unavailable"
+
+    ERR_UNINITIALISED = ERR_UNAVAILABLE_SERVICE  # EX_UNAVAILABLE in sysexit.h
+    "Service unavailable"
+
+    ERR_CANNOT_EXECUTE_CMD = 126
+    "Command cannot be executed"
+
+    ERR_CMD_EXECUTION_PERMISSION_DENIED = 126
+    "Operation unauthorized"
+
+    ERR_CMD_NOT_FOUND = 127
+    "Command not found"
+
+    ERR_FILE_NOT_FOUND = ERR_CMD_NOT_FOUND
+    "File not found"
+
+    ERR_DIR_NOT_FOUND = ERR_CMD_NOT_FOUND
+    "Directory not found"
+
+    ERR_UNDERLYING_CMD_ERR = 128
+    "Underlying command execution error"
+
+    ERR_SIGINT_RECEIVED = 130  # Ctrl-C
+    "Interrupt signal received"
+
+
+# region module level aliases of ExitCode members
+EXIT_OK = ExitCode.EXIT_OK
 "Everything is okay"
 
-ERR_EXIT_OK = EXIT_OK
+ERR_EXIT_OK = ExitCode.ERR_EXIT_OK
 "Everything is okay"
 
-ERR_GENERIC_ERR = 1
+ERR_GENERIC_ERR = ExitCode.ERR_GENERIC_ERR
 "Some generic error"
 
-ERR_INVALID_USAGE = 2
+ERR_INVALID_USAGE = ExitCode.ERR_INVALID_USAGE
 "Invalid usage command"
 
-ERR_STATE_ALREADY_EXISTS = 4
+ERR_STATE_ALREADY_EXISTS = ExitCode.ERR_STATE_ALREADY_EXISTS
 "State already exists"
 
-ERR_FILE_ALREADY_EXISTS = ERR_STATE_ALREADY_EXISTS
+ERR_FILE_ALREADY_EXISTS = ExitCode.ERR_FILE_ALREADY_EXISTS
 "File already exists"
 
-ERR_DIR_ALREADY_EXISTS = ERR_STATE_ALREADY_EXISTS
+ERR_DIR_ALREADY_EXISTS = ExitCode.ERR_DIR_ALREADY_EXISTS
 "Directory already exists"
 
-ERR_DATA_FORMAT_ERR = 65  # EX_DATAERR in sysexits.h
+ERR_DATA_FORMAT_ERR = ExitCode.ERR_DATA_FORMAT_ERR
 "Data format error, for example, while reading from a config file"
 
-ERR_UNAVAILABLE_SERVICE = 69  # EX_UNAVAILABLE in sysexit.h
+ERR_UNAVAILABLE_SERVICE = ExitCode.ERR_UNAVAILABLE_SERVICE
 "Service unavailable"
 
-ERR_UNSTABLE_STATE = ERR_UNAVAILABLE_SERVICE  # EX_UNAVAILABLE in sysexit.h
+ERR_UNSTABLE_STATE = ExitCode.ERR_UNSTABLE_STATE
 "Service unavailable"
 
-ERR_UNINITIALISED = ERR_UNAVAILABLE_SERVICE  # EX_UNAVAILABLE in sysexit.h
+ERR_UNINITIALISED = ExitCode.ERR_UNINITIALISED
 "Service unavailable"
 
-ERR_CANNOT_EXECUTE_CMD = 126
+ERR_CANNOT_EXECUTE_CMD = ExitCode.ERR_CANNOT_EXECUTE_CMD
 "Command cannot be executed"
 
-ERR_CMD_EXECUTION_PERMISSION_DENIED = 126
+ERR_CMD_EXECUTION_PERMISSION_DENIED = ExitCode.ERR_CMD_EXECUTION_PERMISSION_DENIED
 "Operation unauthorized"
 
-ERR_CMD_NOT_FOUND = 127
+ERR_CMD_NOT_FOUND = ExitCode.ERR_CMD_NOT_FOUND
 "Command not found"
 
-ERR_FILE_NOT_FOUND = ERR_CMD_NOT_FOUND
+ERR_FILE_NOT_FOUND = ExitCode.ERR_FILE_NOT_FOUND
 "File not found"
 
-ERR_DIR_NOT_FOUND = ERR_CMD_NOT_FOUND
+ERR_DIR_NOT_FOUND = ExitCode.ERR_DIR_NOT_FOUND
 "Directory not found"
 
-ERR_UNDERLYING_CMD_ERR = 128
+ERR_UNDERLYING_CMD_ERR = ExitCode.ERR_UNDERLYING_CMD_ERR
 "Underlying command execution error"
 
-ERR_SIGINT_RECEIVED = 130  # Ctrl-C
+ERR_SIGINT_RECEIVED = ExitCode.ERR_SIGINT_RECEIVED
 "Interrupt signal received"
+# endregion
@@ -5,18 +5,24 @@
 Exceptions and exception hierarchies native to `Vaastav Technologies (OPC) Private Limited` python code.
 """
 
-from abc import abstractmethod
-from subprocess import CalledProcessError
-from typing import Protocol, override, overload
-from vt.utils.commons.commons.core_py import fallback_on_none_strict
-from vt.utils.errors.error_specs import (
-    ERR_GENERIC_ERR,
-    ERR_CMD_NOT_FOUND,
-    ErrorMsgFormer,
-)
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Final, Protocol, override, overload
+from vt.utils.errors.error_specs.error_codes import ERR_GENERIC_ERR, ERR_CMD_NOT_FOUND
+from vt.utils.errors.error_specs.errmsg import ErrorMsgFormer
+
+
+if TYPE_CHECKING:
+    # subprocess is only imported at runtime when a command exception's cause is validated.
+    from subprocess import CalledProcessError
 
 errmsg = ErrorMsgFormer
 
+_NO_KWARGS: Final[Mapping[str, Any]] = MappingProxyType({})
+"""
+Class level read-only ``kwargs`` of exceptions that are constructed without any extra keyword-args.
+"""
+
 
 class HasExitCode(Protocol):
     """
@@ -25,7 +31,6 @@ class HasExitCode(Protocol):
     """
 
     @property
-    @abstractmethod
     def exit_code(self) -> int:
         """
         :return: an exit code which can be used by applications during time of exit to denote
@@ -41,6 +46,11 @@ class VTException(Exception):
     Encapsulates any known exception raised by known code and hence can be handled in internal projects, like CLI(s).
     """
 
+    kwargs: Mapping[str, Any] = _NO_KWARGS
+    """
+    extra keyword-args supplied at construction for more info storage. Only set on the instance when supplied.
+    """
+
     def __init__(self, *args, **kwargs):
         """
         Examples:
@@ -127,11 +137,33 @@ class VTException(Exception):
             ...     v.cause
             ValueError('cause message.')
 
+          * supplied keyword-args are retained as a ``dict``, a read-only empty mapping is used otherwise:
+
+            >>> VTException('main message.', key='value').kwargs
+            {'key': 'value'}
+
+            >>> VTException('main message.').kwargs
+            mappingproxy({})
+
         :param args: arguments for ``Exception``.
-        :param kwargs: extra keyword-args for more info storage.
+        :param kwargs: extra keyword-args for more info storage. Retained in ``kwargs``, which is a read-only empty
+            mapping when no keyword-args are supplied.
+        """
+        self._init_vt(args, kwargs)
+
+    def _init_vt(self, args: tuple[Any, ...], kwargs: dict[str, Any]) -> None:
+        """
+        Initialisation shared by the whole hierarchy. Subclasses call this directly with their already packed
+        ``args`` and ``kwargs`` instead of re-packing them through ``super().__init__()``.
+
+        Cooperative ``super().__init__()`` is still called, hence, mixins later in the MRO are initialised.
+
+        :param args: arguments for ``Exception``.
+        :param kwargs: extra keyword-args for more info storage, retained in ``kwargs`` only when supplied.
         """
         super().__init__(*args)
-        self.kwargs = kwargs
+        if kwargs:
+            self.kwargs = kwargs
 
     @property
     def cause(self) -> BaseException | None:
@@ -141,32 +173,93 @@ class VTException(Exception):
         return self.__cause__
 
     def __str__(self) -> str:
-        if not self.args and self.cause:
-            if not self.cause.args:
-                return f"{self.cause.__class__.__name__}"
-            else:
-                return f"{self.cause.__class__.__name__}: {self.cause.__str__()}"
-        if self.args and not self.cause:
-            return super().__str__()
-        if self.args and self.cause:
-            return f"{self.cause.__class__.__name__}: {super().__str__()}"
-        return ""
+        return self._render()[0]
+
+    def _render(self) -> tuple[str, str | None, str | None]:
+        """
+        Single pass rendering of this exception shared by ``__str__()`` and ``to_dict()``.
+
+        :return: the exception message, the cause type name and the cause message. The cause message is only
+            rendered when the exception message is formed out of it, else it is ``None``.
+        """
+        cause = self.cause
+        if cause is None:
+            return (super().__str__() if self.args else ""), None, None
+        cause_type = type(cause).__name__
+        if self.args:
+            return f"{cause_type}: {super().__str__()}", cause_type, None
+        if not cause.args:
+            return cause_type, cause_type, None
+        cause_msg = str(cause)
+        return f"{cause_type}: {cause_msg}", cause_type, cause_msg
 
     def to_dict(self) -> dict[str, str | None]:
         """
+        Examples::
+
+            >>> VTException('main message.').to_dict()
+            {'type': 'VTException', 'message': 'main message.', 'cause_type': None, 'cause_message': None}
+
+            >>> try:
+            ...     raise VTException() from ValueError('cause message.')
+            ... except VTException as v:
+            ...     v.to_dict()
+            {'type': 'VTException', 'message': 'ValueError: cause message.', 'cause_type': 'ValueError', 'cause_message': 'cause message.'}
+
         :return: a structured dict version of the exception for structured logging.
         """
+        message, cause_type, cause_message = self._render()
+        if type(self).__str__ is not VTException.__str__:
+            message = str(self)
+        if cause_type is not None and cause_message is None:
+            cause_message = str(self.cause)
         return {
-            "type": self.__class__.__name__,
-            "message": str(self),
-            "cause_type": type(self.cause).__name__ if self.cause else None,
-            "cause_message": str(self.cause) if self.cause else None,
+            "type": type(self).__name__,
+            "message": message,
+            "cause_type": cause_type,
+            "cause_message": cause_message,
         }
 
 
 class VTExitingException(VTException, HasExitCode):
     """
     A ``VTException`` that contains error code for exiting an application, if needed.
+
+    Can be combined with builtin exceptions that have their own instance layout::
+
+        >>> class ExitingFileNotFoundError(VTExitingException, FileNotFoundError): pass
+        >>> ExitingFileNotFoundError('Missing.', exit_code=3).exit_code
+        3
+
+        >>> str(ExitingFileNotFoundError(2, 'Missing'))
+        '[Errno 2] Missing'
+
+        >>> class ExitingKeyError(VTExitingException, KeyError): pass
+        >>> str(ExitingKeyError('key'))
+        "'key'"
+
+    Mixins later in the MRO are initialised cooperatively::
+
+        >>> class Tagged(Exception):
+        ...     def __init__(self, *args):
+        ...         super().__init__(*args)
+        ...         self.tag = 'tagged'
+        >>> class TaggedExitingException(VTExitingException, Tagged): pass
+        >>> TaggedExitingException('Expected.', exit_code=2).tag
+        'tagged'
+
+    Picklable, along with the exit code and extra keyword-args::
+
+        >>> import pickle
+        >>> e = pickle.loads(pickle.dumps(VTExitingException('Expected.', exit_code=20, meta='x')))
+        >>> e.exit_code, e.kwargs['meta'], str(e)
+        (20, 'x', 'Expected.')
+    """
+
+    exit_code: int = ERR_GENERIC_ERR
+    """
+    exit code which can be used by applications during time of exit to denote an exit, error or ok condition.
+    Shadows the ``HasExitCode.exit_code`` property so that it can be set on instances.
     """
 
     def __init__(self, *args, exit_code: int = ERR_GENERIC_ERR, **kwargs):
@@ -249,17 +342,18 @@ class VTExitingException(VTException, HasExitCode):
             ...     v.cause
             ValueError('Unexpected value.')
 
+          * ``exit_code`` is only stored once, it is not retained in ``kwargs``:
+
+            >>> ve = VTExitingException('Expected.', exit_code=20, meta='x')
+            >>> ve.exit_code, dict(ve.kwargs)
+            (20, {'meta': 'x'})
+
         :param args: arguments for ``Exception``.
         :param exit_code: exit code if application needs to exit.
         :param kwargs: extra keyword-args for more info storage.
         """
-        super().__init__(*args, exit_code=exit_code, **kwargs)
-        self._exit_code = exit_code
-
-    @override
-    @property
-    def exit_code(self) -> int:
-        return self._exit_code
+        self._init_vt(args, kwargs)
+        self.exit_code = exit_code
 
 
 class VTCmdException(VTExitingException):
@@ -271,7 +365,7 @@ class VTCmdException(VTExitingException):
     def __init__(
         self,
         *args,
-        called_process_error: CalledProcessError,
+        called_process_error: "CalledProcessError",
         exit_code: int | None = None,
         **kwargs,
     ):
@@ -369,23 +463,22 @@ class VTCmdException(VTExitingException):
             ``None`` supplied or exit code not provided by the user.
         :param kwargs: extra keyword-args for more info storage.
         """
-        super().__init__(
-            *args,
-            exit_code=fallback_on_none_strict(
-                exit_code, called_process_error.returncode
-            ),
-            **kwargs,
+        self._init_vt(args, kwargs)
+        self.exit_code = (
+            called_process_error.returncode if exit_code is None else exit_code
         )
         self.called_process_error = called_process_error
+        self._validated_cause: "CalledProcessError | None" = None
 
     @override
     @property
-    def cause(self) -> CalledProcessError:
+    def cause(self) -> "CalledProcessError":
         """
         Examples:
 
           * Fallback to called_process_error if no cause is set:
 
+            >>> from subprocess import CalledProcessError
             >>> cpe = CalledProcessError(1, ['git', 'status'], output='err', stderr='fail')
             >>> ex = VTCmdException('git failed', called_process_error=cpe)
             >>> ex.cause is cpe
@@ -431,13 +524,20 @@ class VTCmdException(VTExitingException):
         :raise TypeError: if the exception's ``__cause__``, which is set by the ``from`` clause, is anything different
             from ``CalledProcessError``.
         """
-        if self.__cause__ is not None:
-            if not isinstance(self.__cause__, CalledProcessError):
-                raise TypeError(
-                    f"Expected cause to be CalledProcessError, got {type(self.__cause__)}."
-                )
-            return self.__cause__
-        return self.called_process_error
+        cause = self.__cause__
+        if cause is None:
+            return self.called_process_error
+        # validate once per cause, __cause__ may still be reassigned later on.
+        if cause is self._validated_cause:
+            return self._validated_cause
+        from subprocess import CalledProcessError
+
+        if not isinstance(cause, CalledProcessError):
+            raise TypeError(
+                f"Expected cause to be CalledProcessError, got {type(cause)}."
+            )
+        self._validated_cause = cause
+        return cause
 
 
 class VTCmdNotFoundError(VTExitingException):
@@ -595,7 +695,7 @@ class VTCmdNotFoundError(VTExitingException):
             >>> _f = FileNotFoundError('fake-cmd')
             >>> ve = VTCmdNotFoundError('Custom fail', file_not_found_error=_f, exit_code=ERR_CMD_NOT_FOUND) # always use the `from` clause.
             >>> ve.exit_code
-            127
+            <ExitCode.ERR_CMD_NOT_FOUND: 127>
 
           * Explicit override of exit code:
 
@@ -637,9 +737,11 @@ class VTCmdNotFoundError(VTExitingException):
             raise TypeError(
                 "file_not_found_error must be of type/subtype FileNotFoundError"
             )
-        super().__init__(*args, exit_code=exit_code, **kwargs)
+        self._init_vt(args, kwargs)
+        self.exit_code = exit_code
         self.command = command
         self.file_not_found_error = file_not_found_error
+        self._validated_cause: FileNotFoundError | None = None
 
     @override
     @property
@@ -694,10 +796,15 @@ class VTCmdNotFoundError(VTExitingException):
         :raise TypeError: if the exception's ``__cause__``, which is set by the ``from`` clause, is anything different
             from ``CalledProcessError``.
         """
-        if self.__cause__ is not None:
-            if not isinstance(self.__cause__, FileNotFoundError):
-                raise TypeError(
-                    f"Expected cause to be FileNotFoundError, got {type(self.__cause__)}."
-                )
-            return self.__cause__
-        return self.file_not_found_error
+        cause = self.__cause__
+        if cause is None:
+            return self.file_not_found_error
+        # validate once per cause, __cause__ may still be reassigned later on.
+        if cause is self._validated_cause:
+            return self._validated_cause
+        if not isinstance(cause, FileNotFoundError):
+            raise TypeError(
+                f"Expected cause to be FileNotFoundError, got {type(cause)}."
+            )
+        self._validated_cause = cause
+        return cause
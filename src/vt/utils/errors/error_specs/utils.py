@@ -6,72 +6,81 @@ Utility functions for error handling.
 """
 
 from collections import deque
-from collections.abc import Iterable
-from typing import overload, TypeGuard
+from collections.abc import Iterable, Mapping
+from typing import TYPE_CHECKING, NoReturn, overload, TypeGuard
 
 from vt.utils.errors.error_specs import ERR_DATA_FORMAT_ERR, type_name_map
 from vt.utils.errors.error_specs.exceptions import VTExitingException
 
+_SENTINEL = object()
+"""
+Marker returned by ``next()`` on an exhausted iterator while checking emptiness in ``require_iterable()``.
+"""
 
-# region require_type() and its overloads
-@overload
-def require_type(
-    val_to_check: bool,
-    var_name: str,
-    val_type: type[bool],
-    exception_to_raise: type[VTExitingException] = VTExitingException,
-    exit_code: int = ERR_DATA_FORMAT_ERR,
-    *,
-    prefix: str = "",
-    suffix: str = "",
-    lenient: bool = False,
-    type_name_mapping: dict[type, str] | None = None,
-) -> TypeGuard[bool]: ...
-
-
-@overload
-def require_type(
-    val_to_check: int,
-    var_name: str,
-    val_type: type[int],
-    exception_to_raise: type[VTExitingException] = VTExitingException,
-    exit_code: int = ERR_DATA_FORMAT_ERR,
-    *,
-    prefix: str = "",
-    suffix: str = "",
-    lenient: bool = False,
-    type_name_mapping: dict[type, str] | None = None,
-) -> TypeGuard[int]: ...
-
-
-@overload
-def require_type(
-    val_to_check: float,
-    var_name: str,
-    val_type: type[float],
-    exception_to_raise: type[VTExitingException] = VTExitingException,
-    exit_code: int = ERR_DATA_FORMAT_ERR,
-    *,
-    prefix: str = "",
-    suffix: str = "",
-    lenient: bool = False,
-    type_name_mapping: dict[type, str] | None = None,
-) -> TypeGuard[float]: ...
+_INT_ONLY_ITERABLES: frozenset[type] = frozenset({range, bytes, bytearray})
+"""
+Iterable types whose items are always ``int``, their items are not scanned by ``require_iterable()`` for int items.
+"""
 
 
-@overload
-def require_type(
-    val_to_check: str,
-    var_name: str,
-    val_type: type[str],
-    exception_to_raise: type[VTExitingException] = VTExitingException,
-    exit_code: int = ERR_DATA_FORMAT_ERR,
-    *,
-    prefix: str = "",
-    suffix: str = "",
-    lenient: bool = False,
-    type_name_mapping: dict[type, str] | None = None,
-) -> TypeGuard[str]: ...
+# region require_type() and its overloads
+if TYPE_CHECKING:
+
+    @overload
+    def require_type(
+        val_to_check: bool,
+        var_name: str,
+        val_type: type[bool],
+        exception_to_raise: type[VTExitingException] = VTExitingException,
+        exit_code: int = ERR_DATA_FORMAT_ERR,
+        *,
+        prefix: str = "",
+        suffix: str = "",
+        lenient: bool = False,
+        type_name_mapping: Mapping[type, str] | None = None,
+    ) -> TypeGuard[bool]: ...
+
+    @overload
+    def require_type(
+        val_to_check: int,
+        var_name: str,
+        val_type: type[int],
+        exception_to_raise: type[VTExitingException] = VTExitingException,
+        exit_code: int = ERR_DATA_FORMAT_ERR,
+        *,
+        prefix: str = "",
+        suffix: str = "",
+        lenient: bool = False,
+        type_name_mapping: Mapping[type, str] | None = None,
+    ) -> TypeGuard[int]: ...
+
+    @overload
+    def require_type(
+        val_to_check: float,
+        var_name: str,
+        val_type: type[float],
+        exception_to_raise: type[VTExitingException] = VTExitingException,
+        exit_code: int = ERR_DATA_FORMAT_ERR,
+        *,
+        prefix: str = "",
+        suffix: str = "",
+        lenient: bool = False,
+        type_name_mapping: Mapping[type, str] | None = None,
+    ) -> TypeGuard[float]: ...
+
+    @overload
+    def require_type(
+        val_to_check: str,
+        var_name: str,
+        val_type: type[str],
+        exception_to_raise: type[VTExitingException] = VTExitingException,
+        exit_code: int = ERR_DATA_FORMAT_ERR,
+        *,
+        prefix: str = "",
+        suffix: str = "",
+        lenient: bool = False,
+        type_name_mapping: Mapping[type, str] | None = None,
+    ) -> TypeGuard[str]: ...
 
 
 def require_type[T](
@@ -84,7 +93,7 @@ def require_type[T](
     prefix: str = "",
     suffix: str = "",
     lenient: bool = False,
-    type_name_mapping: dict[type, str] | None = None,
+    type_name_mapping: Mapping[type, str] | None = None,
 ) -> TypeGuard[T]:
     """
     Validates that the provided value matches the specified type. If it does not,
@@ -145,96 +154,123 @@ def require_type[T](
     Traceback (most recent call last):
     error_specs.utils.MyTypedException: TypeError: 'is_ready' must be a boolean
     """
-    actual_type = type(val_to_check)
-    if (not lenient and actual_type is not val_type) or (
-        lenient and not isinstance(val_to_check, val_type)
-    ):
-        type_name_mapping = type_name_mapping or type_name_map
-        typename = type_name_mapping.get(
-            val_type, f"an instance of {getattr(val_type, '__name__', str(val_type))}"
-        )
-        errmsg = f"{prefix}'{var_name}' must be {typename}{suffix}"
-        raise exception_to_raise(errmsg, exit_code=exit_code) from TypeError(errmsg)
-    return True
-
-
-# endregion
-
-
-# region require_iterable() and its overloads
-@overload
-def require_iterable[T](
-    val_to_check: list[T],
-    var_name: str,
-    item_type: type[T] | None = ...,
-    enforce: type[list] = ...,
-    exception_to_raise: type[VTExitingException] = ...,
-    exit_code: int = ...,
-    *,
-    prefix: str = ...,
-    suffix: str = ...,
-    empty: bool | None = ...,
-) -> TypeGuard[list[T]]: ...
-
-
-@overload
-def require_iterable[T](
-    val_to_check: tuple[T, ...],
+    # exact type match passes in both strict and lenient modes, no isinstance() dispatch needed.
+    if type(val_to_check) is val_type:
+        return True
+    if lenient and isinstance(val_to_check, val_type):
+        return True
+    _raise_type_error(
+        var_name,
+        val_type,
+        exception_to_raise,
+        exit_code,
+        prefix,
+        suffix,
+        type_name_mapping,
+    )
+
+
+def _raise_type_error(
     var_name: str,
-    item_type: type[T] | None = ...,
-    enforce: type[tuple] = ...,
-    exception_to_raise: type[VTExitingException] = ...,
-    exit_code: int = ...,
-    *,
-    prefix: str = ...,
-    suffix: str = ...,
-    empty: bool | None = ...,
-) -> TypeGuard[tuple[T, ...]]: ...
+    val_type: type,
+    exception_to_raise: type[VTExitingException],
+    exit_code: int,
+    prefix: str,
+    suffix: str,
+    type_name_mapping: Mapping[type, str] | None,
+) -> NoReturn:
+    """
+    Slow path of ``require_type()``, kept out of it so that its success path stays small.
 
+    >>> _raise_type_error("count", int, VTExitingException, 3, "", ".", None)
+    Traceback (most recent call last):
+    vt.utils.errors.error_specs.exceptions.VTExitingException: TypeError: 'count' must be an int.
 
-@overload
-def require_iterable[T](
-    val_to_check: set[T],
-    var_name: str,
-    item_type: type[T] | None = ...,
-    enforce: type[set] = ...,
-    exception_to_raise: type[VTExitingException] = ...,
-    exit_code: int = ...,
-    *,
-    prefix: str = ...,
-    suffix: str = ...,
-    empty: bool | None = ...,
-) -> TypeGuard[set[T]]: ...
+    :raises exception_to_raise: always, chained from a ``TypeError`` with the same message.
+    """
+    type_name_mapping = type_name_mapping or type_name_map
+    typename = type_name_mapping.get(
+        val_type, f"an instance of {getattr(val_type, '__name__', str(val_type))}"
+    )
+    errmsg = f"{prefix}'{var_name}' must be {typename}{suffix}"
+    raise exception_to_raise(errmsg, exit_code=exit_code) from TypeError(errmsg)
 
 
-@overload
-def require_iterable[T](
-    val_to_check: deque[T],
-    var_name: str,
-    item_type: type[T] | None = ...,
-    enforce: type[deque] = ...,
-    exception_to_raise: type[VTExitingException] = ...,
-    exit_code: int = ...,
-    *,
-    prefix: str = ...,
-    suffix: str = ...,
-    empty: bool | None = ...,
-) -> TypeGuard[deque[T]]: ...
+# endregion
 
 
-@overload
-def require_iterable(
-    val_to_check: range,
-    var_name: str,
-    item_type: type[int] | None = ...,
-    enforce: type[range] = ...,
-    exception_to_raise: type[VTExitingException] = ...,
-    exit_code: int = ...,
-    *,
-    prefix: str = ...,
-    suffix: str = ...,
-    empty: bool | None = ...,
-) -> TypeGuard[range]: ...
+# region require_iterable() and its overloads
+if TYPE_CHECKING:
+
+    @overload
+    def require_iterable[T](
+        val_to_check: list[T],
+        var_name: str,
+        item_type: type[T] | None = ...,
+        enforce: type[list] = ...,
+        exception_to_raise: type[VTExitingException] = ...,
+        exit_code: int = ...,
+        *,
+        prefix: str = ...,
+        suffix: str = ...,
+        empty: bool | None = ...,
+    ) -> TypeGuard[list[T]]: ...
+
+    @overload
+    def require_iterable[T](
+        val_to_check: tuple[T, ...],
+        var_name: str,
+        item_type: type[T] | None = ...,
+        enforce: type[tuple] = ...,
+        exception_to_raise: type[VTExitingException] = ...,
+        exit_code: int = ...,
+        *,
+        prefix: str = ...,
+        suffix: str = ...,
+        empty: bool | None = ...,
+    ) -> TypeGuard[tuple[T, ...]]: ...
+
+    @overload
+    def require_iterable[T](
+        val_to_check: set[T],
+        var_name: str,
+        item_type: type[T] | None = ...,
+        enforce: type[set] = ...,
+        exception_to_raise: type[VTExitingException] = ...,
+        exit_code: int = ...,
+        *,
+        prefix: str = ...,
+        suffix: str = ...,
+        empty: bool | None = ...,
+    ) -> TypeGuard[set[T]]: ...
+
+    @overload
+    def require_iterable[T](
+        val_to_check: deque[T],
+        var_name: str,
+        item_type: type[T] | None = ...,
+        enforce: type[deque] = ...,
+        exception_to_raise: type[VTExitingException] = ...,
+        exit_code: int = ...,
+        *,
+        prefix: str = ...,
+        suffix: str = ...,
+        empty: bool | None = ...,
+    ) -> TypeGuard[deque[T]]: ...
+
+    @overload
+    def require_iterable(
+        val_to_check: range,
+        var_name: str,
+        item_type: type[int] | None = ...,
+        enforce: type[range] = ...,
+        exception_to_raise: type[VTExitingException] = ...,
+        exit_code: int = ...,
+        *,
+        prefix: str = ...,
+        suffix: str = ...,
+        empty: bool | None = ...,
+    ) -> TypeGuard[range]: ...
 
 
 def require_iterable[T](
@@ -299,6 +335,13 @@ def require_iterable[T](
         Traceback (most recent call last):
         vt.utils.errors.error_specs.exceptions.VTExitingException: TypeError: 'not_iter' must be a non-str iterable
 
+        Rejecting enum members, even though their enum class is iterable::
+
+        >>> from vt.utils.errors.error_specs import ExitCode
+        >>> _ = require_iterable(ExitCode.EXIT_OK, "exit_code", item_type=int)
+        Traceback (most recent call last):
+        vt.utils.errors.error_specs.exceptions.VTExitingException: TypeError: 'exit_code' must be a non-str iterable
+
         Rejecting string even though it is iterable::
 
         >>> require_iterable("abc", "str_input") # type: ignore[arg-type] # expects non-str iterable, provided str
@@ -316,33 +359,218 @@ def require_iterable[T](
         >>> _ = require_iterable([1], "should_be_empty", empty=True)
         Traceback (most recent call last):
         vt.utils.errors.error_specs.exceptions.VTExitingException: ValueError: 'should_be_empty' must be empty
+
+        Containers that only yield ints (range, bytes, bytearray) are accepted without scanning their items::
+
+        >>> require_iterable(range(10**12), "ids", item_type=int, enforce=range)
+        True
+
+        >>> require_iterable(b"bytes", "octets", item_type=int)
+        True
+
+        >>> require_iterable(range(3), "flags", item_type=bool)
+        Traceback (most recent call last):
+        vt.utils.errors.error_specs.exceptions.VTExitingException: TypeError: 'flags' must be a iterable of bools
+
+        Containers longer than ``sys.maxsize`` are probed for their first item as ``len()`` overflows::
+
+        >>> require_iterable(range(10**20), "huge", empty=False)
+        True
+
+        Unsized iterables are probed for their first item only::
+
+        >>> _ = require_iterable(iter([]), "exhausted", empty=False)
+        Traceback (most recent call last):
+        vt.utils.errors.error_specs.exceptions.VTExitingException: ValueError: 'exhausted' must not be empty
     """
 
-    if isinstance(val_to_check, str) or not isinstance(val_to_check, Iterable):
+    if not _is_non_str_iterable(val_to_check):
         errmsg = f"{prefix}'{var_name}' must be a non-str iterable{suffix}"
-        raise exception_to_raise(errmsg, exit_code=exit_code) from TypeError(errmsg)
+        _raise_iter_error(errmsg, TypeError, exception_to_raise, exit_code)
 
-    iterable_type_str = "iterable"
     if enforce is not None:
-        iterable_type_str = getattr(enforce, "__name__", str(enforce))
-        if not isinstance(val_to_check, enforce):
+        if type(val_to_check) is not enforce and not isinstance(val_to_check, enforce):
             errmsg = f"{prefix}'{var_name}' must be of type {enforce.__name__}{suffix}"
-            raise exception_to_raise(errmsg, exit_code=exit_code) from TypeError(errmsg)
-
-    if empty is True and any(True for _ in val_to_check):
-        errmsg = f"{prefix}'{var_name}' must be empty{suffix}"
-        raise exception_to_raise(errmsg, exit_code=exit_code) from ValueError(errmsg)
-    if empty is False and not any(True for _ in val_to_check):
-        errmsg = f"{prefix}'{var_name}' must not be empty{suffix}"
-        raise exception_to_raise(errmsg, exit_code=exit_code) from ValueError(errmsg)
-
-    if item_type is not None:
+            _raise_iter_error(errmsg, TypeError, exception_to_raise, exit_code)
+
+    if empty is not None:
+        is_empty = _is_empty(val_to_check)
+        if empty is True and not is_empty:
+            errmsg = f"{prefix}'{var_name}' must be empty{suffix}"
+            _raise_iter_error(errmsg, ValueError, exception_to_raise, exit_code)
+        if empty is False and is_empty:
+            errmsg = f"{prefix}'{var_name}' must not be empty{suffix}"
+            _raise_iter_error(errmsg, ValueError, exception_to_raise, exit_code)
+
+    if item_type is not None and not _yields_only(val_to_check, item_type):
         for v in val_to_check:
             if not isinstance(v, item_type):
-                errmsg = f"{prefix}'{var_name}' must be a {iterable_type_str} of {item_type.__name__}s{suffix}"
-                raise exception_to_raise(errmsg, exit_code=exit_code) from TypeError(
-                    errmsg
+                iterable_type_str = (
+                    "iterable"
+                    if enforce is None
+                    else getattr(enforce, "__name__", str(enforce))
                 )
+                errmsg = f"{prefix}'{var_name}' must be a {iterable_type_str} of {item_type.__name__}s{suffix}"
+                _raise_iter_error(errmsg, TypeError, exception_to_raise, exit_code)
+    return True
+
+
+def _raise_iter_error(
+    errmsg: str,
+    cause_type: type[TypeError] | type[ValueError],
+    exception_to_raise: type[VTExitingException],
+    exit_code: int,
+) -> NoReturn:
+    """
+    Slow path shared by all the checks of ``require_iterable()``, kept out of it so that its success path stays small.
+
+    >>> _raise_iter_error("'items' must be empty", ValueError, VTExitingException, 3)
+    Traceback (most recent call last):
+    vt.utils.errors.error_specs.exceptions.VTExitingException: ValueError: 'items' must be empty
+
+    :raises exception_to_raise: always, chained from a ``cause_type`` error with the same message.
+    """
+    raise exception_to_raise(errmsg, exit_code=exit_code) from cause_type(errmsg)
+
+
+# endregion
+
+
+def _is_non_str_iterable(val: object) -> bool:
+    """
+    Duck-typed equivalent of ``not isinstance(val, str) and isinstance(val, Iterable)`` without the ABC
+    ``__instancecheck__`` dispatch. Like ``Iterable``, only an ``__iter__`` defined for instances, i.e. in the MRO of
+    the type, counts and one set to ``None`` disables iteration. An ``__iter__`` on the metaclass, as on ``Enum``
+    classes, is not one of the instance.
+
+    >>> from enum import Enum
+    >>> class Color(Enum):
+    ...     RED = 1
+    >>> _is_non_str_iterable([1]), _is_non_str_iterable("abc"), _is_non_str_iterable(Color.RED)
+    (True, False, False)
+
+    :return: ``True`` if ``val`` is a non-str iterable.
+    """
+    if isinstance(val, str):
+        return False
+    for klass in type(val).__mro__:
+        if "__iter__" in klass.__dict__:
+            return klass.__dict__["__iter__"] is not None
+    return False
+
+
+def _is_empty(iterable: Iterable) -> bool:
+    """
+    :return: ``True`` if ``iterable`` has no items. Sized containers are checked by ``len()``, others are probed
+        for their first item only.
+
+    >>> _is_empty([]), _is_empty(iter([1])), _is_empty(range(10**20))
+    (True, False, False)
+    """
+    try:
+        return len(iterable) == 0  # type: ignore[arg-type] # unsized iterables handled below
+    except (TypeError, OverflowError):  # unsized, or longer than sys.maxsize
+        return next(iter(iterable), _SENTINEL) is _SENTINEL
+
+
+def _yields_only(iterable: Iterable, item_type: type) -> bool:
+    """
+    :return: ``True`` if the type of ``iterable`` alone guarantees that all its items are ``item_type`` instances.
+    """
+    # these containers only ever yield ints, so their items need no scan when ints are acceptable items.
+    return type(iterable) in _INT_ONLY_ITERABLES and issubclass(int, item_type)
+
+
+# region check_type() and check_iterable()
+def check_type[T](
+    val_to_check: object, val_type: type[T], *, lenient: bool = False
+) -> TypeGuard[T]:
+    """
+    Predicate counterpart of ``require_type()``. Returns ``False`` instead of building and raising an exception,
+    for callers that recover from a type mismatch.
+
+    Examples::
+
+        >>> check_type(123, int)
+        True
+
+        >>> check_type(True, int)
+        False
+
+        >>> check_type(True, int, lenient=True)
+        True
+
+        >>> check_type(None, str)
+        False
+
+    :param val_to_check: The value to check.
+    :param val_type: The expected type of the value.
+    :param lenient: If True, subclasses of ``val_type`` are also accepted, as by ``isinstance()``. If False, the type
+        must match exactly.
+    :return: ``True`` if ``val_to_check`` is of ``val_type``, else ``False``.
+    """
+    if type(val_to_check) is val_type:
+        return True
+    return lenient and isinstance(val_to_check, val_type)
+
+
+def check_iterable[T](
+    val_to_check: object,
+    item_type: type[T] | None = None,
+    enforce: type[Iterable] | None = None,
+    *,
+    empty: bool | None = None,
+) -> TypeGuard[Iterable[T]]:
+    """
+    Predicate counterpart of ``require_iterable()``. Returns ``False`` instead of building and raising an exception,
+    for callers that recover from an invalid iterable.
+
+    Examples::
+
+        >>> check_iterable([1, 2, 3], int)
+        True
+
+        >>> check_iterable([1, "two"], int)
+        False
+
+        >>> check_iterable("abc")
+        False
+
+        >>> from vt.utils.errors.error_specs import ExitCode
+        >>> check_iterable(ExitCode.EXIT_OK, int)
+        False
+
+        >>> check_iterable({1, 2}, int, enforce=list)
+        False
+
+        >>> check_iterable([], empty=True), check_iterable([], empty=False)
+        (True, False)
+
+        >>> check_iterable(range(10**12), int)
+        True
+
+    :param val_to_check: The value to check as a non-str iterable.
+    :param item_type: If given, all the items must be of this type.
+    :param enforce: Optional concrete iterable type to enforce (e.g. list, set, tuple, deque, range).
+    :param empty: If True, the iterable must be empty; if False, it must not be.
+    :return: ``True`` if all the checks pass, else ``False``.
+    """
+    if not _is_non_str_iterable(val_to_check):
+        return False
+    if (
+        enforce is not None
+        and type(val_to_check) is not enforce
+        and not isinstance(val_to_check, enforce)
+    ):
+        return False
+    iterable: Iterable = val_to_check  # type: ignore[assignment] # checked for __iter__ above
+    if empty is not None and _is_empty(iterable) is not empty:
+        return False
+    if item_type is None or _yields_only(iterable, item_type):
+        return True
+    for v in iterable:
+        if not isinstance(v, item_type):
+            return False
     return True
 
 